@@ -1,34 +1,91 @@
 import os
-from dotenv import load_dotenv
+import functools
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from dotenv import find_dotenv, load_dotenv, dotenv_values
+
+# Resolved once, walking up from this file like a bare load_dotenv() did;
+# "" when no .env file exists
+_ENV_FILE = find_dotenv()
+
+
+def _env_mtime() -> float:
+    """Modification time of the .env file, or 0 if there is none"""
+    try:
+        return os.path.getmtime(_ENV_FILE)
+    except OSError:
+        return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env(mtime: float) -> None:
+    """Load the .env file once per modification time"""
+    load_dotenv(_ENV_FILE)
+
+
+@functools.lru_cache(maxsize=1)
+def _dotenv_values(mtime: float) -> Dict[str, Optional[str]]:
+    return dotenv_values(_ENV_FILE)
+
+
+def dotenv_env() -> Dict[str, Optional[str]]:
+    """Parsed contents of the .env file, re-read only when its mtime changes"""
+    return _dotenv_values(_env_mtime())
+
 
 # Load environemntal variables
-load_dotenv()
+_load_env(_env_mtime())
 
 
+@dataclass(frozen=True)
 class Config:
     "Configurations for LLM"
 
     # API KEYS
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
-    SERPER_API_KEY = os.getenv("SERPER_API_KEY")
+    OPENAI_API_KEY: Optional[str] = field(default=os.getenv("OPENAI_API_KEY"), repr=False)
+    TAVILY_API_KEY: Optional[str] = field(default=os.getenv("TAVILY_API_KEY"), repr=False)
+    SERPER_API_KEY: Optional[str] = field(default=os.getenv("SERPER_API_KEY"), repr=False)
 
 
     # LLM Config
-    LLM_MODEL = "gpt-4o-mini"
-    LLM_TEMPERATURE = 0.1
-    LLM_MAX_TOKENS = 10000
+    LLM_MODEL: str = "gpt-4o-mini"
+    LLM_TEMPERATURE: float = 0.1
+    LLM_MAX_TOKENS: int = 10000
 
     # FILE Config
-    MAX_FILE_SIZE_MB = 5
-    ALLOWED_FILE_TYPES = [".pdf", ".docx", ".txt"]
-    UPLOAD_DIR =  "uploads/"
+    MAX_FILE_SIZE_MB: int = 5
+    ALLOWED_FILE_TYPES: Tuple[str, ...] = (".pdf", ".docx", ".txt")
+    UPLOAD_DIR: str =  "uploads/"
 
     # Workflow Config
-    MAX_JOBS_TO_FIND = 10
-    MAX_JOBS_TO_SCORE = 10
-    ENABLE_JOB_SEARCH = True
+    MAX_JOBS_TO_FIND: int = 10
+    MAX_JOBS_TO_SCORE: int = 10
+    ENABLE_JOB_SEARCH: bool = True
     
     # Job Seach Settings
-    JOB_SEARCH_ENGINE  = "tavily"
-    DEFAULT_LOCATION = "remote"
\ No newline at end of file
+    JOB_SEARCH_ENGINE: str  = "tavily"
+    DEFAULT_LOCATION: str = "remote"
+
+
+# Single config instance, built once at import
+config = Config()
+
+# Module-level bindings so callers resolve settings as plain globals
+OPENAI_API_KEY = config.OPENAI_API_KEY
+TAVILY_API_KEY = config.TAVILY_API_KEY
+SERPER_API_KEY = config.SERPER_API_KEY
+
+LLM_MODEL = config.LLM_MODEL
+LLM_TEMPERATURE = config.LLM_TEMPERATURE
+LLM_MAX_TOKENS = config.LLM_MAX_TOKENS
+
+MAX_FILE_SIZE_MB = config.MAX_FILE_SIZE_MB
+ALLOWED_FILE_TYPES = config.ALLOWED_FILE_TYPES
+UPLOAD_DIR = config.UPLOAD_DIR
+
+MAX_JOBS_TO_FIND = config.MAX_JOBS_TO_FIND
+MAX_JOBS_TO_SCORE = config.MAX_JOBS_TO_SCORE
+ENABLE_JOB_SEARCH = config.ENABLE_JOB_SEARCH
+
+JOB_SEARCH_ENGINE = config.JOB_SEARCH_ENGINE
+DEFAULT_LOCATION = config.DEFAULT_LOCATION
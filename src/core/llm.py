@@ -1,30 +1,142 @@
 import os
-from langchain_openai import ChatOpenAI
+import atexit
+import base64
+import functools
+import mmap
+from typing import Any, Callable, Dict, List, Tuple, Union
 from langchain_core.messages import HumanMessage
-from tavily import TavilypiClient
-from langchain_community.utilities import GoogleSerperAPIWrapper
-from core.config import Config
+from core.config import (
+    OPENAI_API_KEY as _OPENAI_API_KEY,
+    TAVILY_API_KEY as _TAVILY_API_KEY,
+    SERPER_API_KEY as _SERPER_API_KEY,
+    LLM_MODEL as _LLM_MODEL,
+    LLM_TEMPERATURE as _LLM_TEMPERATURE,
+    LLM_MAX_TOKENS as _LLM_MAX_TOKENS,
+)
+
+# Job boards Tavily searches are restricted to
+_JOB_DOMAINS = ("indeed.com", "linkedin.com", "glassdoor.com", "hirist.com", "naukari.com")
+
+
+@functools.cache
+def _shared_http_client():
+    """Pooled httpx client shared by every LLM client, closed at interpreter exit"""
+    import httpx
+
+    client = httpx.Client(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=30,
+    )
+    atexit.register(client.close)
+    return client
+
+
+# Expected failures from each SDK. The tuples are built on first failure
+# so the SDK modules are not imported just to declare error handling.
+@functools.cache
+def _llm_errors() -> Tuple[type, ...]:
+    import httpx
+    import openai
+    return (openai.OpenAIError, httpx.HTTPError)
+
+
+@functools.cache
+def _tavily_errors() -> Tuple[type, ...]:
+    import requests
+    from tavily.errors import (
+        BadRequestError,
+        ForbiddenError,
+        InvalidAPIKeyError,
+        TimeoutError as TavilyTimeoutError,
+        UsageLimitExceededError,
+    )
+    return (
+        requests.RequestException,
+        BadRequestError,
+        ForbiddenError,
+        InvalidAPIKeyError,
+        TavilyTimeoutError,
+        UsageLimitExceededError,
+    )
+
+
+@functools.cache
+def _serper_errors() -> Tuple[type, ...]:
+    import requests
+    return (requests.RequestException,)
+
+
+@functools.lru_cache(maxsize=4)
+def _b64_for(file_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Base64-encode a file straight from a read-only mmap, without reading it into memory first.
+    Cached on (path, mtime, size) so re-analysing an unchanged file skips the read and encode.
+    At the 5 MB upload limit each entry is ~6.7 MB, so the cache holds at most ~27 MB;
+    call _b64_for.cache_clear() to release it.
+    """
+    # mmap refuses zero-length files
+    if size == 0:
+        return ""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm).decode('ascii')
+
+
+def _build_pdf_content(prompt: str, file_path: str, st: os.stat_result) -> List[Dict[str, Any]]:
+    """For PDF files, use base64 with data URL format"""
+    file_base64 = _b64_for(file_path, st.st_mtime_ns, st.st_size)
+    return [
+        {"type": "text", "text": prompt},
+        {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:application/pdf;base64,{file_base64}"
+            }
+        }
+    ]
+
+
+def _build_txt_content(prompt: str, file_path: str, st: os.stat_result) -> str:
+    """For text files, just read the content directly and include it in the prompt"""
+    with open(file_path, 'rb') as file:
+        file_text = file.read().decode('utf-8', errors='ignore')
+    return f"{prompt}\n\nFILE CONTENT:\n{file_text}"
+
+
+# Message content builders per file extension. OpenAI doesn't directly
+# support DOCX, so it needs a text-extraction builder before it can be added.
+_CONTENT_BUILDERS: Dict[str, Callable[[str, str, os.stat_result], Union[str, List[Dict[str, Any]]]]] = {
+    ".pdf": _build_pdf_content,
+    ".txt": _build_txt_content,
+}
+
 
 class LLMClient:
     "LLM Client for interacting with LLM"
 
     def __init__(self):
+        # Heavy SDKs are imported here so importing this module stays cheap
+        from langchain_openai import ChatOpenAI
+
         self.llm = ChatOpenAI(
-            model = Config.LLM_MODEL, 
-            temperature = Config.LLM_TEMPERATURE, 
-            max_tokens = Config.LLM_MAX_TOKENS, 
-            openai_api_key = Config.OPENAI_API_KEY
+            model = _LLM_MODEL, 
+            temperature = _LLM_TEMPERATURE, 
+            max_tokens = _LLM_MAX_TOKENS, 
+            openai_api_key = _OPENAI_API_KEY,
+            http_client = _shared_http_client()
         )
 
         # Initialize Search Clients
         self.tavily_client = None
         self.serper_wrapper = None
 
-        if Config.TAVILY_API_KEY:
-            self.tavily_client = TavilypiClient(api_key=Config.TAVILY_API_KEY)
+        if _TAVILY_API_KEY:
+            from tavily import TavilyClient
+            self.tavily_client = TavilyClient(api_key=_TAVILY_API_KEY)
 
-        if Config.SERPER_API_KEY:
-            self.serper_wrapper = GoogleSerperAPIWrapper(serper_api_key=Config.SERPER_API_KEY)
+        if _SERPER_API_KEY:
+            from langchain_community.utilities import GoogleSerperAPIWrapper
+            self.serper_wrapper = GoogleSerperAPIWrapper(serper_api_key=_SERPER_API_KEY)
 
     def chat_with_file(self, prompt: str, file_path: str) -> str:
         """
@@ -39,53 +151,25 @@ class LLMClient:
         """
         try:
             # Validate file first
-            from utils.simple_utils import validate_file
-            is_valid, error_msg = validate_file(file_path)
+            from utils.utilities import get_file_extension, stat_file, validate_file_stat
+            st = stat_file(file_path)
+            is_valid, error_msg = validate_file_stat(file_path, st)
             if not is_valid:
                 return f"File validation error: {error_msg}"
             
-            # Read file as base64
-            import base64
-            with open(file_path, 'rb') as file:
-                file_content = file.read()
-                file_base64 = base64.b64encode(file_content).decode('utf-8')
-            
             # Get file extension to determine approach
-            file_ext = os.path.splitext(file_path.lower())[1]
-            
-            if file_ext == '.pdf':
-                # For PDF files, use base64 with data URL format
-                content = [
-                    {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:application/pdf;base64,{file_base64}"
-                        }
-                    }
-                ]
-            else:
-                # For other files (DOCX, TXT), convert to text first and include in prompt
-                # Since OpenAI doesn't directly support DOCX, we need to extract text
-                if file_ext == '.txt':
-                    # For text files, just read the content directly
-                    file_text = file_content.decode('utf-8', errors='ignore')
-                    full_prompt = f"{prompt}\n\nFILE CONTENT:\n{file_text}"
-                    content = full_prompt
-                else:
-                    # For unsupported formats, return error
-                    return f"File type {file_ext} is not directly supported by OpenAI API"
+            file_ext = get_file_extension(file_path)
             
-            # Create message
-            if isinstance(content, list):
-                message = HumanMessage(content=content)
-            else:
-                message = HumanMessage(content=content)
+            handler = _CONTENT_BUILDERS.get(file_ext)
+            if handler is None:
+                # For unsupported formats, return error
+                return f"File type {file_ext} is not directly supported by OpenAI API"
             
+            message = HumanMessage(content=handler(prompt, file_path, st))
             response = self.llm.invoke([message])
             return response.content
             
-        except Exception as e:
+        except (OSError, ValueError, *_llm_errors()) as e:
             return f"Error with LLM: {str(e)}"
     
 
@@ -102,8 +186,8 @@ class LLMClient:
         try: 
             message = HumanMessage(content=prompt)
             response = self.llm.invoke([message])
-            return response.contents
-        except Exception as e:
+            return response.content
+        except _llm_errors() as e:
             return f"Error with LLM: {str(e)}"
     
     def search_jobs(self, query: str, max_results: int = 10) -> str:
@@ -132,7 +216,7 @@ class LLMClient:
             response = self.tavily_client.search(
                 query=query,
                 max_results=max_results,
-                include_domains=["indeed.com", "linkedin.com", "glassdoor.com", "hirist.com", "naukari.com"]
+                include_domains=_JOB_DOMAINS
             )
             
             results = response.get("results", [])
@@ -140,21 +224,15 @@ class LLMClient:
                 return "No job results found"
             
             # Format results nicely
-            formatted_results = []
-            for result in results:
-                title = result.get("title", "")
-                url = result.get("url", "")
-                content = result.get("content", "")
-                
-                formatted_results.append(f"""
-                **{title}**
-                URL: {url}
-                Description: {content[:300]}...
-                ---""")
-            
-            return "\n".join(formatted_results)
+            return "\n".join(
+                f"\n**{result.get('title', '')}**"
+                f"\nURL: {result.get('url', '')}"
+                f"\nDescription: {result.get('content', '')[:300]}..."
+                "\n---"
+                for result in results
+            )
             
-        except Exception as e:
+        except _tavily_errors() as e:
             return f"Tavily search error: {str(e)}"
         
     def _search_with_serper(self, query: str) -> str:
@@ -168,9 +246,11 @@ class LLMClient:
             
             return results
             
-        except Exception as e:
+        except _serper_errors() as e:
             return f"Serper search error: {str(e)}"
 
 
-# Global LLM client instance
-llm_client = LLMClient()
\ No newline at end of file
+@functools.cache
+def get_llm_client() -> LLMClient:
+    """Shared LLM client instance, created on first use"""
+    return LLMClient()
@@ -10,7 +10,7 @@ the flow of data between the four main agents:
 """
 
 from typing import List, Dict, Optional, Any, TypedDict, Annotated
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langgraph.graph import add_messages
 from langchain_core.messages import BaseMessage
 
@@ -18,6 +18,8 @@ from langchain_core.messages import BaseMessage
 # Data Models for structured information
 class ResumeData(BaseModel):
     """Structured resume information extracted by Resume Intelligence Agent"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     raw_text: str = Field(description="Raw extracted text from resume file")
     parsed_sections: Dict[str, Any] = Field(
         default_factory=dict,
@@ -33,6 +35,8 @@ class ResumeData(BaseModel):
 
 class JobMatch(BaseModel):
     """Individual job match found by Job Market Research Agent"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str = Field(description="Job title")
     company: str = Field(description="Company name")
     location: str = Field(description="Job location")
@@ -49,6 +53,8 @@ class JobMatch(BaseModel):
 
 class ATSScore(BaseModel):
     """ATS compatibility score for a specific job"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     job_title: str = Field(description="Job title this score is for")
     overall_score: int = Field(description="Overall ATS score 0-100")
     keyword_score: int = Field(description="Keyword matching score 0-100")
@@ -70,6 +76,8 @@ class ATSScore(BaseModel):
 
 class ResumeEnhancement(BaseModel):
     """Specific points and improvements to add to resume based on job descriptions"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     missing_skills_to_add: List[str] = Field(
         default_factory=list,
         description="Skills to add to resume skills section"
@@ -182,41 +190,60 @@ def create_initial_state(
     """
     from datetime import datetime
     
-    return ResumeAnalysisState(
-        messages=[],
-        uploaded_file_path=uploaded_file_path,
-        target_job_title=target_job_title,
-        target_industry=target_industry,
-        target_location=target_location,
-        experience_level=experience_level,
-        resume_data=None,
-        parsing_errors=[],
-        file_format=None,
-        parsing_confidence=None,
-        matching_jobs=[],
-        job_search_errors=[],
-        search_query_used=None,
-        total_jobs_found=0,
-        ats_scores=[],
-        average_ats_score=None,
-        best_ats_match=None,
-        improvement_recommendations=[],
-        resume_enhancements=None,
-        personalized_tips=[],
-        priority_improvements=[],
-        current_step="initialized",
-        errors=[],
-        warnings=[],
-        is_complete=False,
-        processing_time_seconds=None,
-        workflow_version="1.0.0",
-        timestamp_started=datetime.now().isoformat(),
-        timestamp_completed=None,
-        user_id=None
-    )
+    state: ResumeAnalysisState = {
+        "messages": [],
+        "uploaded_file_path": uploaded_file_path,
+        "target_job_title": target_job_title,
+        "target_industry": target_industry,
+        "target_location": target_location,
+        "experience_level": experience_level,
+        "resume_data": None,
+        "parsing_errors": [],
+        "file_format": None,
+        "parsing_confidence": None,
+        "matching_jobs": [],
+        "job_search_errors": [],
+        "search_query_used": None,
+        "total_jobs_found": 0,
+        "ats_scores": [],
+        "average_ats_score": None,
+        "best_ats_match": None,
+        "improvement_recommendations": [],
+        "resume_enhancements": None,
+        "personalized_tips": [],
+        "priority_improvements": [],
+        "current_step": "initialized",
+        "errors": [],
+        "warnings": [],
+        "is_complete": False,
+        "processing_time_seconds": None,
+        "workflow_version": "1.0.0",
+        "timestamp_started": datetime.now().isoformat(),
+        "timestamp_completed": None,
+        "user_id": None
+    }
+    return state
 
 
 # State validation helpers
+_VALID_TRANSITIONS = frozenset([
+    ("initialized", "parsing_resume"),
+    ("parsing_resume", "resume_parsed"),
+    ("parsing_resume", "error"),
+    ("resume_parsed", "searching_jobs"),
+    ("searching_jobs", "jobs_found"),
+    ("searching_jobs", "error"),
+    ("jobs_found", "scoring_ats"),
+    ("scoring_ats", "ats_scored"),
+    ("scoring_ats", "error"),
+    ("ats_scored", "generating_advice"),
+    ("generating_advice", "completed"),
+    ("generating_advice", "error"),
+    ("error", "retry"),
+    ("error", "completed"),
+])
+
+
 def validate_state_transition(from_step: str, to_step: str) -> bool:
     """
     Validate that a state transition is allowed
@@ -228,20 +255,21 @@ def validate_state_transition(from_step: str, to_step: str) -> bool:
     Returns:
         True if transition is valid
     """
-    valid_transitions = {
-        "initialized": ["parsing_resume"],
-        "parsing_resume": ["resume_parsed", "error"],
-        "resume_parsed": ["searching_jobs"],
-        "searching_jobs": ["jobs_found", "error"], 
-        "jobs_found": ["scoring_ats"],
-        "scoring_ats": ["ats_scored", "error"],
-        "ats_scored": ["generating_advice"],
-        "generating_advice": ["completed", "error"],
-        "error": ["retry", "completed"],
-        "completed": []
-    }
-    
-    return to_step in valid_transitions.get(from_step, [])
+    return (from_step, to_step) in _VALID_TRANSITIONS
+
+
+_STEP_PROGRESS: Dict[str, float] = {
+    "initialized": 0.0,
+    "parsing_resume": 10.0,
+    "resume_parsed": 25.0,
+    "searching_jobs": 40.0,
+    "jobs_found": 60.0,
+    "scoring_ats": 75.0,
+    "ats_scored": 85.0,
+    "generating_advice": 95.0,
+    "completed": 100.0,
+    "error": 0.0
+}
 
 
 def get_state_progress_percentage(current_step: str) -> float:
@@ -254,17 +282,4 @@ def get_state_progress_percentage(current_step: str) -> float:
     Returns:
         Progress percentage 0-100
     """
-    step_progress = {
-        "initialized": 0.0,
-        "parsing_resume": 10.0,
-        "resume_parsed": 25.0,
-        "searching_jobs": 40.0,
-        "jobs_found": 60.0,
-        "scoring_ats": 75.0,
-        "ats_scored": 85.0,
-        "generating_advice": 95.0,
-        "completed": 100.0,
-        "error": 0.0
-    }
-    
-    return step_progress.get(current_step, 0.0)
\ No newline at end of file
+    return _STEP_PROGRESS.get(current_step, 0.0)
\ No newline at end of file
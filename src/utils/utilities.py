@@ -1,5 +1,8 @@
 import os
 from typing import Tuple, Optional, Dict, Any
+from core.config import ALLOWED_FILE_TYPES
+
+_ALLOWED_EXT = frozenset(ALLOWED_FILE_TYPES)
 
 
 def validate_file(file_path: str, max_size_mb: int = 5) -> Tuple[bool, Optional[str]]:
@@ -13,30 +16,82 @@ def validate_file(file_path: str, max_size_mb: int = 5) -> Tuple[bool, Optional[
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not os.path.exists(file_path):
+    return validate_file_stat(file_path, stat_file(file_path), max_size_mb)
+
+
+def stat_file(file_path: str) -> Optional[os.stat_result]:
+    """Stat a file, or None if it cannot be stat'ed"""
+    try:
+        return os.stat(file_path)
+    except (OSError, ValueError):
+        return None
+
+
+def validate_file_stat(
+    file_path: str,
+    st: Optional[os.stat_result],
+    max_size_mb: int = 5
+) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a file from a stat result the caller already has, so the file is only stat'ed once
+    
+    Args:
+        file_path: Path to file
+        st: Result of stat_file(file_path)
+        max_size_mb: Maximum file size in MB
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    if st is None:
         return False, "File does not exist"
     
     # Check file size
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    file_size_mb = st.st_size / (1024 * 1024)
     if file_size_mb > max_size_mb:
         return False, f"File too large: {file_size_mb:.1f}MB (max: {max_size_mb}MB)"
     
     # Check file extension
-    allowed_extensions = ['.pdf', '.docx', '.txt']
-    file_ext = os.path.splitext(file_path.lower())[1]
-    if file_ext not in allowed_extensions:
-        return False, f"Unsupported file type: {file_ext}. Allowed: {allowed_extensions}"
+    file_ext = get_file_extension(file_path)
+    if file_ext not in _ALLOWED_EXT:
+        return False, f"Unsupported file type: {file_ext}. Allowed: {list(ALLOWED_FILE_TYPES)}"
     
     return True, None
 
 
+def get_file_extension(file_path: str) -> str:
+    """
+    Lowercased file extension including the dot, or "" if there is none.
+    Like os.path.splitext, leading dots of the file name do not start an extension.
+    
+    >>> get_file_extension("uploads/Resume.PDF")
+    '.pdf'
+    >>> get_file_extension("uploads.d/resume")
+    ''
+    >>> get_file_extension("uploads/.pdf")
+    ''
+    >>> get_file_extension("a/..pdf")
+    ''
+    """
+    file_name = file_path
+    for sep in (os.sep, os.altsep):
+        if sep:
+            file_name = file_name.rpartition(sep)[2]
+    stem, dot, ext = file_name.rpartition('.')
+    if not dot or not stem.strip('.'):
+        return ""
+    return '.' + ext.lower()
+
+
 def get_file_info(file_path: str) -> dict:
     """Get basic file information"""
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except (OSError, ValueError):
         return {"error": "File not found"}
     
-    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-    file_ext = os.path.splitext(file_path)[1].lower()
+    file_size_mb = st.st_size / (1024 * 1024)
+    file_ext = get_file_extension(file_path)
     
     return {
         "filename": os.path.basename(file_path),